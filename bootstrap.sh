@@ -11,10 +11,20 @@ echo "username -> ${USERNAME}"
 
 source utils/colors.sh
 source utils/detect_os.sh
+source utils/sanity_checks.sh
 
 
 print_info "Running it for first time"
 
+echo
+echo "[Checking Internet]"
+# Fail fast here, before the OS scripts start package-manager and clone
+# work that would otherwise hang through long network timeouts.
+if ! check_internet; then
+	print_error "No internet connection detected. Aborting..."
+	exit 1
+fi
+
 echo
 echo "[Sudo]"
 echo "Running 'sudo' up-front, so that we don't hassle you later."
@@ -24,9 +34,13 @@ sudo sleep 0
 echo
 echo "[Detecting OS]"
 
-OS=`detect_os`
+# Call detect_os directly rather than in a command substitution: a
+# substitution runs in a subshell, which would throw away the cached
+# DETECTED_OS and force every later caller to re-detect.
+detect_os > /dev/null
+OS=$DETECTED_OS
 
-if [ $? != 0 ]; then
+if [ $DETECTED_OS_FOUND != 0 ]; then
 	print_error "Sorry, you appear to be running an Unknown OS. Aborting..."	exit 1
 fi
 
@@ -51,7 +65,11 @@ print_success "You're ready to Work!"
 echo
 
 if [[ $OS == $OS_UBUNTU ]]; then
-    print_info "You must restart."
+    if detect_wsl; then
+        print_info "Please restart your WSL session ('wsl --shutdown' from Windows)."
+    else
+        print_info "You must restart."
+    fi
 else
     print_info "Please start a *new* terminal."
 fi
@@ -8,44 +8,75 @@ echo
 echo "[Xcode Command Line Tools]"
 echo "Installing Xcode Command Line Tools..."
 xcode-select --install 2> /dev/null
-read -p "Please press Enter once the Xcode Command Line Tools are installed. [enter]" IGNORE
+
+# Homebrew's index update only needs the network, not Xcode, so start it
+# now and let it run while we wait for the user above.
+if [ -d /usr/local/Cellar ]; then
+	brew update > /dev/null 2>&1 &
+	BREW_UPDATE_PID=$!
+fi
+
+# Print the prompt ourselves: read -p means "read from coprocess" in
+# zsh, not "prompt" as in bash. The || true keeps Ctrl-D (EOF) or a
+# non-interactive stdin from killing the whole bootstrap here.
+echo "Please press Enter once the Xcode Command Line Tools are installed. [enter]"
+read -r IGNORE || true
 
 
 echo
 echo "[Homebrew]"
 if [ -d /usr/local/Cellar ]; then
 	echo "Homebrew appears to be already installed. Updating..."
-	brew update
+	wait $BREW_UPDATE_PID
 	brew upgrade
 else
 	echo "Installing Homebrew"
-	/usr/bin/ruby -e "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/master/install)" || exit 1
+	# Pipe the installer straight into ruby so it starts interpreting
+	# while the download is still arriving, instead of buffering the
+	# whole script in a command substitution first.
+	curl -fsSL https://raw.githubusercontent.com/Homebrew/install/master/install | /usr/bin/ruby || exit 1
 	#brew tap Homebrew/bundle
 	brew bundle --file os/mac-brewfile
 fi
 
 
 echo
-echo "[Python]"
+echo "[Homebrew Packages]"
 export PYENV_ROOT="$HOME/.pyenv"
 
 source utils/sanity_checks.sh
 
+# Collect everything we need from Homebrew and install it in one shot;
+# each separate `brew install` pays the full brew startup cost again.
+BREW_PACKAGES=()
+
 if [ ! -d $PYENV_ROOT ]; then
-	echo "Installing pyenv via Homebrew..."
-	brew install pyenv
-	check_installation_of "pyenv"
+	BREW_PACKAGES+=(pyenv)
+fi
+
+if ! command_exists direnv; then
+	BREW_PACKAGES+=(direnv)
 fi
 
-# Check to see if pyenv is on the $PATH like it should be...
-PYENV_FOUND=`echo $PATH | grep "${PYENV_ROOT}"`
+if [ ${#BREW_PACKAGES[@]} -gt 0 ]; then
+	echo "Installing via Homebrew: ${BREW_PACKAGES[@]}"
+	brew install ${BREW_PACKAGES[@]}
+	check_installation_of "${BREW_PACKAGES[*]}"
+fi
 
-if [[ "${PYENV_FOUND}" == "" ]]; then
+
+echo
+echo "[Python]"
+
+# Check to see if pyenv is on the $PATH like it should be... a shell
+# pattern match, so no echo | grep pipeline buffering $PATH through two
+# extra processes.
+if [[ "$PATH" != *"$PYENV_ROOT"* ]]; then
     echo "Adding pyenv to your PATH..."
     export PATH="$PYENV_ROOT/bin:$PATH"
 fi
 
-if command -v pyenv 1>/dev/null 2>&1; then
+if command_exists pyenv; then
     eval "$(pyenv init -)"
 else
     echo
@@ -63,17 +94,6 @@ echo "Installing global python packages..."
 export PYENV_VERSION=2.7.16
 pip install -U -q ipython virtualenv pudb pipenv || exit 1
 
-echo
-echo "[Direnv]"
-if ! command -v direnv 1>/dev/null 2>&1; then
-  echo
-  echo "[direnv]"
-  echo "Installing direnv via Homebrew..."
-  brew install direnv
-  check_installation_of "direnv"
-fi
-
-
 echo
 echo "[Man Pages]"
 echo "Fixing man page paths..."
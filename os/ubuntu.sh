@@ -0,0 +1,32 @@
+#!/bin/zsh
+
+
+echo "Running Ubuntu-specific setup"
+
+
+echo
+echo "[Apt Packages]"
+source utils/sanity_checks.sh
+
+# One apt invocation for everything we need: each separate apt install
+# pays the dpkg lock, cache read and trigger processing all over again.
+APT_PACKAGES=(git curl zsh tmux fontconfig)
+
+sudo apt-get update
+sudo DEBIAN_FRONTEND=noninteractive apt-get install -y \
+	--no-install-recommends \
+	-o Dpkg::Use-Pty=0 -o Acquire::Retries=3 \
+	${APT_PACKAGES[@]} || exit 1
+
+
+echo
+echo "[Zsh]"
+source zsh/install.sh
+
+
+echo
+echo "[Tmux]"
+source tmux/install.sh
+
+
+source utils/ssh.sh
@@ -1 +1,6 @@
+# Move a pre-existing real .tmux.conf out of the way instead of
+# clobbering it; a rename is O(1) whatever the file's size.
+if [ -f ~/.tmux.conf ] && [ ! -L ~/.tmux.conf ]; then
+	mv ~/.tmux.conf ~/.tmux.conf.backup.`date +%s`
+fi
 ln -sf ~/Work/personal/.dotfiles/tmux/.tmux.conf ~/.tmux.conf
@@ -1,8 +1,31 @@
-# Update App Store Apps
-sudo softwareupdate -i -a
+# Prime sudo first so the backgrounded update below doesn't stall on a
+# password prompt.
+sudo -v
+
+# Update App Store Apps in the background; it's network-bound and
+# independent of Homebrew, so the two updates run side by side.
+sudo softwareupdate -i -a &
 
 
 # Update Homebrew (Cask) & Packages
 brew update
 brew upgrade
 
+
+# Update Oh My Zsh and the plugin repos. Each pull is network-bound and
+# independent, so run them all at once and wait together.
+ZSH_CUSTOM=${ZSH_CUSTOM:-$HOME/.oh-my-zsh/custom}
+
+for repo in \
+	$HOME/.oh-my-zsh \
+	$ZSH_CUSTOM/plugins/zsh-autosuggestions \
+	$ZSH_CUSTOM/plugins/zsh-syntax-highlighting
+do
+	if [ -d "$repo/.git" ]; then
+		git -C "$repo" pull --ff-only --no-tags &
+	fi
+done
+
+
+# Wait for the App Store update and all the pulls together.
+wait
@@ -1,5 +1,12 @@
 #!/bin/bash
 
+# These helpers are sourced from several scripts; load them only once
+# per shell so repeated sourcing costs nothing.
+if [ -n "$COLORS_SH_LOADED" ]; then
+	return 0
+fi
+COLORS_SH_LOADED=1
+
 txtred='\033[0;31m'
 txtgreen='\033[0;32m'
 txtyellow='\033[0;33m'
@@ -7,20 +14,27 @@ txtlightblue='\033[1;36m'
 
 txtrst='\033[0m'    # Text Reset
 
+# Full printf templates, assembled once instead of on every call. Passing
+# the message as an argument also keeps any % in it from being expanded.
+fmtred="${txtred}%b${txtrst}\n"
+fmtgreen="${txtgreen}%b${txtrst}\n"
+fmtyellow="${txtyellow}%b${txtrst}\n"
+fmtlightblue="${txtlightblue}%b${txtrst}\n"
+
 
 print_error () {
-    printf "${txtred}${1}${txtrst}\n"
+    printf "$fmtred" "$1"
 }
 
 print_warning () {
-    printf "${txtyellow}${1}${txtrst}\n"
+    printf "$fmtyellow" "$1"
 }
 
 print_info () {
-    printf "${txtlightblue}${1}${txtrst}\n"
+    printf "$fmtlightblue" "$1"
 }
 
 print_success () {
-    printf "${txtgreen}${1}${txtrst}\n"
+    printf "$fmtgreen" "$1"
 }
 
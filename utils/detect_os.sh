@@ -1,6 +1,13 @@
 #!/bin/zsh
 
 
+# Sourced from several scripts; load only once per shell.
+if [ -n "$DETECT_OS_SH_LOADED" ]; then
+	return 0
+fi
+DETECT_OS_SH_LOADED=1
+
+
 export OS_MAC="macOS"
 export OS_UBUNTU="Ubuntu"
 export OS_WINDOWS="Windows"
@@ -8,6 +15,14 @@ export OS_UNKNOWN="Unknown"
 
 
 function detect_os() {
+	# The answer can't change mid-run, so detect once and replay the
+	# cached result on later calls instead of re-running uname and the
+	# distro checks.
+	if [ -n "$DETECTED_OS" ]; then
+		echo $DETECTED_OS
+		return $DETECTED_OS_FOUND
+	fi
+
 	OS=$OS_UNKNOWN
 	FOUND=1
 
@@ -17,14 +32,15 @@ function detect_os() {
 			FOUND=0
 			;;
 		Linux)
-			if ! hash lsb_release 2> /dev/null; then
-				OS=$OS_UNKNOWN
+			# /etc/os-release is plain key=value and present on every
+			# modern distro, so one read replaces the lsb_release fork
+			# and its grep pipeline.
+			DISTRO_ID=""
+			if [ -r /etc/os-release ]; then
+				DISTRO_ID=`. /etc/os-release && echo $ID`
 			fi
-			
-			DISTRO=`lsb_release -i`
-			IS_UBUNTU=`echo $DISTRO | grep -o 'Ubuntu'`
-			
-			if [[ $IS_UBUNTU -eq "Ubuntu" ]]; then
+
+			if [[ "$DISTRO_ID" == "ubuntu" ]]; then
 				OS=$OS_UBUNTU
 				FOUND=0
 			fi
@@ -34,8 +50,31 @@ function detect_os() {
 			FOUND=0
 			;;
 	esac
-	
+
+	export DETECTED_OS=$OS
+	export DETECTED_OS_FOUND=$FOUND
+
 	echo $OS
 	return $FOUND
 }
 
+
+function detect_wsl() {
+	# /proc/version mentions Microsoft on both WSL1 and WSL2, where the
+	# uname release string alone is not reliable. Read it once and keep
+	# the answer for the rest of the run.
+	if [ -z "$DETECTED_WSL" ]; then
+		export DETECTED_WSL=no
+
+		if [ -r /proc/version ]; then
+			case "`cat /proc/version`" in
+				*[Mm]icrosoft*)
+					export DETECTED_WSL=yes
+					;;
+			esac
+		fi
+	fi
+
+	[ "$DETECTED_WSL" = "yes" ]
+}
+
@@ -1,6 +1,13 @@
 #!/bin/zsh
 
 
+# Sourced from several scripts; load only once per shell.
+if [ -n "$SANITY_CHECKS_SH_LOADED" ]; then
+	return 0
+fi
+SANITY_CHECKS_SH_LOADED=1
+
+
 check_installation_of()
 {
     if [ $? != 0 ];then
@@ -8,3 +15,40 @@ check_installation_of()
         exit 1
     fi
 }
+
+
+command_exists()
+{
+    # hash remembers the lookup in the shell's command table, so asking
+    # about the same tool twice doesn't walk $PATH again.
+    hash "$1" 2> /dev/null
+}
+
+
+check_internet()
+{
+    # Probe once and remember the answer so every caller after the first
+    # gets it for free. A raw TCP connect to a public resolver settles
+    # in tens of milliseconds either way; if that probe is unavailable
+    # or fails (e.g. a firewall that blocks outbound 53 but allows
+    # HTTPS), fall back to an HTTP probe before giving up. A machine
+    # with no probe tool at all (fresh installs can lack nc, curl and
+    # wget alike) is assumed online: only a probe that actually ran and
+    # failed should abort the bootstrap.
+    if [ -z "$INTERNET_OK" ]; then
+        if ! command_exists nc && ! command_exists curl && ! command_exists wget; then
+            echo "No nc/curl/wget available to probe connectivity; assuming online."
+            INTERNET_OK=yes
+        elif command_exists nc && nc -z -w 2 1.1.1.1 53 > /dev/null 2>&1; then
+            INTERNET_OK=yes
+        elif command_exists curl && curl -fsS --max-time 5 https://www.google.com > /dev/null 2>&1; then
+            INTERNET_OK=yes
+        elif command_exists wget && wget -q --spider --timeout=5 https://www.google.com > /dev/null 2>&1; then
+            INTERNET_OK=yes
+        else
+            INTERNET_OK=no
+        fi
+    fi
+
+    [ "$INTERNET_OK" = "yes" ]
+}
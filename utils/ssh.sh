@@ -1,16 +1,40 @@
+source utils/detect_os.sh
+
+# Seed the cached result in this shell (a no-op when bootstrap.sh has
+# already detected); the branches below just read the variable.
+detect_os > /dev/null
+
 ssh-keygen -t rsa -b 4096 -C "alamin.ineedahelp@gmail.com"
 eval "$(ssh-agent -s)"
 
 FILE=$HOME/.ssh/config
-if ! test -f "$FILE"; then
+# One stat of the path decides both branches; the test was inverted
+# before, so an existing config got appended to and a missing one never
+# got created.
+if test -f "$FILE"; then
 	echo "$FILE exists."
 else
-	touch $FILE
-	echo "Host *
+	# UseKeychain is an Apple-only option; Linux OpenSSH rejects it as
+	# "Bad configuration option" and that breaks every later ssh and
+	# git invocation on the machine.
+	if [ "$DETECTED_OS" = "$OS_MAC" ]; then
+		echo "Host *
   	    AddKeysToAgent yes
   	    UseKeychain yes
   	    IdentityFile ~/.ssh/id_rsa" >> $FILE
+	else
+		echo "Host *
+  	    AddKeysToAgent yes
+  	    IdentityFile ~/.ssh/id_rsa" >> $FILE
+	fi
 	echo "Created $FILE!"
 fi
 
-ssh-add -K ~/.ssh/id_rsa
+# -K means "store the passphrase in the keychain" only on Apple's
+# ssh-add; on Linux it asks for FIDO resident keys and fails, which
+# would sink the whole bootstrap as the last command in this chain.
+if [ "$DETECTED_OS" = "$OS_MAC" ]; then
+	ssh-add -K ~/.ssh/id_rsa
+else
+	ssh-add ~/.ssh/id_rsa
+fi
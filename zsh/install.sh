@@ -1,12 +1,45 @@
 # install omz
 
-#sh -c "$(curl -fsSL https://raw.githubusercontent.com/robbyrussell/oh-my-zsh/master/tools/install.sh)"
-#git clone https://github.com/zsh-users/zsh-autosuggestions ${ZSH_CUSTOM:-~/.oh-my-zsh/custom}/plugins/zsh-autosuggestions
-#git clone https://github.com/zsh-users/zsh-syntax-highlighting.git ${ZSH_CUSTOM:-~/.oh-my-zsh/custom}/plugins/zsh-syntax-highlighting
-
 DOT_DIR=$HOME/Work/personal/.dotfiles
 DOT_ZSH_DIR=$DOT_DIR/zsh
 OMZ_DIR=$HOME/.oh-my-zsh
+ZSH_CUSTOM=${ZSH_CUSTOM:-$OMZ_DIR/custom}
+
+clone_or_pull() {
+	URL=$1
+	TARGET=$2
+
+	if [ -d "$TARGET" ]; then
+		# Skip the pull when we already fetched within the last day;
+		# plugin repos barely move and the round-trip is pure wait.
+		if [ -n "`find \"$TARGET/.git\" -maxdepth 1 -name FETCH_HEAD -mtime -1 2> /dev/null`" ]; then
+			return 0
+		fi
+		# We only track the tip of one branch in these repos, so keep
+		# the pull fast-forward-only and skip tag transfer. git -C
+		# saves the cd subshell fork per repo.
+		git -C "$TARGET" pull --ff-only --no-tags
+	else
+		git clone --depth=1 "$URL" "$TARGET"
+	fi
+}
+
+# Oh My Zsh first: the custom plugin dirs live underneath it, and going
+# through clone_or_pull means a fresh clone is never followed by a
+# redundant pull (and re-runs get the same 24h pull gate as the plugins).
+clone_or_pull https://github.com/robbyrussell/oh-my-zsh.git $OMZ_DIR
+
+# Each clone is network-bound and independent of the others, so run them
+# all at once instead of waiting on them one by one.
+clone_or_pull https://github.com/zsh-users/zsh-autosuggestions $ZSH_CUSTOM/plugins/zsh-autosuggestions &
+clone_or_pull https://github.com/zsh-users/zsh-syntax-highlighting.git $ZSH_CUSTOM/plugins/zsh-syntax-highlighting &
+wait
+
+ln -sf $DOT_ZSH_DIR/themes/alamin.zsh-theme $ZSH_CUSTOM/themes/alamin.zsh-theme
 
-ln -sf $DOT_ZSH_DIR/themes/alamin.zsh-theme ${ZSH_CUSTOM:-~/.oh-my-zsh/custom}/themes/alamin.zsh-theme
+# Move a pre-existing real .zshrc out of the way instead of clobbering
+# it; a rename is O(1) whatever the file's size.
+if [ -f ~/.zshrc ] && [ ! -L ~/.zshrc ]; then
+	mv ~/.zshrc ~/.zshrc.backup.`date +%s`
+fi
 ln -sf $DOT_ZSH_DIR/.zshrc ~/.zshrc